@@ -28,6 +28,7 @@ from eventsourcing.domain import LogEvent  # noqa: F401
 from eventsourcing.domain import TLogEvent  # noqa: F401
 from eventsourcing.domain import (
     Aggregate,
+    CanMutateAggregate,
     CanMutateProtocol,
     CollectEventsProtocol,
     DomainEventProtocol,
@@ -80,6 +81,51 @@ def project_aggregate(
     return aggregate
 
 
+def project_aggregate_trusted(
+    aggregate: Optional[TMutableOrImmutableAggregate],
+    domain_events: Iterable[DomainEventProtocol],
+) -> Optional[TMutableOrImmutableAggregate]:
+    """
+    Projector function for aggregate projections, like project_aggregate(),
+    except that after the first event has been applied by calling its
+    mutate() method, events that would be applied by the default aggregate
+    event mutate() method are applied without checking their originator ID
+    and version, and the aggregate version and modified time are updated
+    only once such events have been applied. It is intended to be used
+    when the given events are known to be a sequence of the aggregate's
+    events, for example when they have been retrieved from an event store.
+    """
+    default_mutate = CanMutateAggregate.mutate
+    is_first_event = True
+    last_applied: Optional[CanMutateAggregate] = None
+    for domain_event in domain_events:
+        if (
+            not is_first_event
+            and isinstance(aggregate, Aggregate)
+            and type(domain_event).mutate is default_mutate  # type: ignore
+        ):
+            domain_event = cast(CanMutateAggregate, domain_event)
+            domain_event.apply(aggregate)
+            last_applied = domain_event
+            continue
+        if last_applied is not None:
+            _update_version_and_modified_on(aggregate, last_applied)
+            last_applied = None
+        assert isinstance(domain_event, CanMutateProtocol)
+        aggregate = domain_event.mutate(aggregate)
+        is_first_event = False
+    if last_applied is not None:
+        _update_version_and_modified_on(aggregate, last_applied)
+    return aggregate
+
+
+def _update_version_and_modified_on(
+    aggregate: Any, domain_event: CanMutateAggregate
+) -> None:
+    aggregate.version = domain_event.originator_version
+    aggregate.modified_on = domain_event.timestamp
+
+
 S = TypeVar("S")
 T = TypeVar("T")
 
@@ -575,8 +621,7 @@ class ProcessingEvent:
                 self.events.append(obj)
             else:
                 if isinstance(obj, CollectEventsProtocol):
-                    for event in obj.collect_events():
-                        self.events.append(event)
+                    self.events.extend(obj.collect_events())
                 self.aggregates[obj.id] = obj
 
         self.saved_kwargs.update(kwargs)
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import dataclasses
 import inspect
 import os
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, tzinfo
-from functools import lru_cache
-from types import FunctionType, WrapperDescriptorType
+from functools import lru_cache, wraps
+from operator import attrgetter, itemgetter
+from types import FunctionType, MethodType, WrapperDescriptorType
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -32,7 +39,7 @@ else:  # pragma: no cover
 
 from uuid import UUID, uuid4
 
-from eventsourcing.utils import get_method_name, get_topic, resolve_topic
+from eventsourcing.utils import get_method_name, get_topic, get_upcasts, resolve_topic
 
 TZINFO: tzinfo = resolve_topic(os.getenv("TZINFO_TOPIC", "datetime:timezone.utc"))
 
@@ -130,8 +137,28 @@ class CanMutateProtocol(DomainEventProtocol, Protocol[TMutableOrImmutableAggrega
         ...  # pragma: no cover
 
 
+_batch_timestamp: ContextVar[Optional[datetime]] = ContextVar(
+    "_batch_timestamp", default=None
+)
+
+
 def create_utc_datetime_now() -> datetime:
-    return datetime.now(tz=TZINFO)
+    return _batch_timestamp.get() or datetime.now(tz=TZINFO)
+
+
+@contextmanager
+def batch_timestamps() -> Iterator[datetime]:
+    """
+    Context manager within which new domain event timestamps have the same
+    value, so that the current time is obtained only once for a batch of
+    new events. Yields the timestamp value.
+    """
+    timestamp = datetime.now(tz=TZINFO)
+    token = _batch_timestamp.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _batch_timestamp.reset(token)
 
 
 class CanCreateTimestamp:
@@ -156,6 +183,9 @@ class HasOriginatorIDVersion:
     originator_version: int
 
 
+_get_mutate_attrs = attrgetter("originator_id", "originator_version", "timestamp")
+
+
 class CanMutateAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
     timestamp: datetime
 
@@ -165,24 +195,25 @@ class CanMutateAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
         according to domain event attributes.
         """
         assert aggregate is not None
+        originator_id, originator_version, timestamp = _get_mutate_attrs(self)
 
         # Check this event belongs to this aggregate.
-        if self.originator_id != aggregate.id:
-            raise OriginatorIDError(self.originator_id, aggregate.id)
+        if originator_id != aggregate.id:
+            raise OriginatorIDError(originator_id, aggregate.id)
 
         # Check this event is the next in its sequence.
         next_version = aggregate.version + 1
-        if self.originator_version != next_version:
-            raise OriginatorVersionError(self.originator_version, next_version)
+        if originator_version != next_version:
+            raise OriginatorVersionError(originator_version, next_version)
 
         # Call apply() before mutating values, in case exception is raised.
         self.apply(aggregate)
 
         # Update the aggregate version.
-        aggregate.version = self.originator_version
+        aggregate.version = originator_version
 
         # Update the modified time.
-        aggregate.modified_on = self.timestamp
+        aggregate.modified_on = timestamp
 
         # Return the mutated aggregate.
         return aggregate
@@ -243,9 +274,76 @@ class MetaDomainEvent(type):
         )
         event_cls = dataclass(frozen=True)(event_cls)
         event_cls.__signature__ = inspect.signature(event_cls.__init__)  # type: ignore
+        if "__init__" not in cls_dict:
+            fast_init = _create_fast_frozen_init(event_cls)
+            if fast_init is not None:
+                event_cls.__init__ = fast_init  # type: ignore
+        if "__hash__" not in cls_dict and _has_originator_fields(event_cls):
+            event_cls.__hash__ = _hash_originator_id_and_version  # type: ignore
         return event_cls
 
 
+def _has_originator_fields(event_cls: type) -> bool:
+    field_names = event_cls.__dataclass_fields__  # type: ignore
+    return "originator_id" in field_names and "originator_version" in field_names
+
+
+def _hash_originator_id_and_version(self: HasOriginatorIDVersion) -> int:
+    """
+    Hashes domain events by their originator ID and version, which is
+    consistent with dataclass equality, without needing to hash the values
+    of all the event attributes, some of which may not be hashable.
+    """
+    return hash((self.originator_id, self.originator_version))
+
+
+_MISSING_ARG = object()
+
+
+def _create_fast_frozen_init(event_cls: type) -> Optional[Callable[..., None]]:
+    """
+    Returns an init method for a frozen dataclass that sets values directly
+    in the instance __dict__, avoiding the cost of calling object.__setattr__()
+    for each field, which is how dataclasses initialise frozen instances.
+
+    Returns None if the dataclass has fields that can't be initialised
+    this way (fields excluded from init, keyword-only fields, or InitVar
+    pseudo-fields), in which case the dataclass init method should be used.
+    """
+    fields = dataclasses.fields(event_cls)
+    if len(fields) != len(event_cls.__dataclass_fields__):  # type: ignore
+        return None
+    if any(not f.init or getattr(f, "kw_only", False) for f in fields):
+        return None
+
+    namespace: Dict[str, Any] = {"__missing_arg__": _MISSING_ARG}
+    params = ["__event_self__"]
+    lines = []
+    for i, f in enumerate(fields):
+        if f.default is not dataclasses.MISSING:
+            namespace[f"__default_{i}__"] = f.default
+            params.append(f"{f.name}=__default_{i}__")
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f"__default_factory_{i}__"] = f.default_factory
+            params.append(f"{f.name}=__missing_arg__")
+            lines.append(
+                f"    if {f.name} is __missing_arg__: {f.name} = __default_factory_{i}__()"
+            )
+        else:
+            params.append(f.name)
+    lines.append("    __event_dict__ = __event_self__.__dict__")
+    for f in fields:
+        lines.append(f"    __event_dict__[{f.name!r}] = {f.name}")
+    if hasattr(event_cls, "__post_init__"):
+        lines.append("    __event_self__.__post_init__()")
+    source = f"def __init__({', '.join(params)}):\n" + "\n".join(lines)
+    exec(source, namespace)
+    init_method = namespace["__init__"]
+    init_method.__qualname__ = f"{event_cls.__qualname__}.__init__"
+    init_method.__module__ = event_cls.__module__
+    return cast(Callable[..., None], init_method)
+
+
 class DomainEvent(CanCreateTimestamp, metaclass=MetaDomainEvent):
     """
     Base class for dataclass domain events.
@@ -302,17 +400,48 @@ class LogEvent(DomainEvent):
 TLogEvent = TypeVar("TLogEvent", bound=DomainEventProtocol)
 
 
+@lru_cache(maxsize=None)
+def _spec_signature(method: Callable[..., Any]) -> inspect.Signature:
+    return inspect.signature(method)
+
+
 def _filter_kwargs_for_method_params(
     kwargs: Dict[str, Any], method: Callable[..., Any]
 ) -> Dict[str, Any]:
     names = _spec_filter_kwargs_for_method_params(method)
-    return {k: v for k, v in kwargs.items() if k in names}
+    return {k: kwargs[k] for k in names if k in kwargs}
 
 
 @lru_cache(maxsize=None)
-def _spec_filter_kwargs_for_method_params(method: Callable[..., Any]) -> Set[str]:
-    method_signature = inspect.signature(method)
-    return set(method_signature.parameters)
+def _spec_filter_kwargs_for_method_params(
+    method: Callable[..., Any]
+) -> Tuple[str, ...]:
+    method_signature = _spec_signature(method)
+    return tuple(method_signature.parameters)
+
+
+@lru_cache(maxsize=None)
+def _spec_positional_args_getter(
+    method: Callable[..., Any]
+) -> Optional[Callable[[Dict[str, Any]], Tuple[Any, ...]]]:
+    """
+    Returns a function that gets the values for the parameters of the given
+    method (after the first) from a dict, as a tuple of positional args. The
+    function raises KeyError if the dict doesn't have a value for each of the
+    parameters. Returns None if the method has parameters that can't be
+    given positionally.
+    """
+    params = list(_spec_signature(method).parameters.values())[1:]
+    if any(p.kind not in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params):
+        return None
+    names = [p.name for p in params]
+    if len(names) == 0:
+        return lambda d: ()
+    elif len(names) == 1:
+        name = names[0]
+        return lambda d: (d[name],)
+    else:
+        return itemgetter(*names)
 
 
 EventSpecType = Union[str, Type[CanMutateAggregate]]
@@ -323,6 +452,17 @@ InjectEventType = bool
 
 
 class CommandMethodDecorator:
+    __slots__ = (
+        "is_name_inferred_from_method",
+        "given_event_cls",
+        "event_cls_name",
+        "decorated_property",
+        "is_property_setter",
+        "property_setter_arg_name",
+        "decorated_method",
+        "trigger_method",
+    )
+
     def __init__(
         self,
         event_spec: Optional[EventSpecType],
@@ -379,7 +519,7 @@ class CommandMethodDecorator:
                 )
 
             # Remember the name of the second setter arg.
-            setter_arg_names = list(inspect.signature(self.decorated_method).parameters)
+            setter_arg_names = list(_spec_signature(self.decorated_method).parameters)
             assert len(setter_arg_names) == 2
             self.property_setter_arg_name = setter_arg_names[1]
 
@@ -406,6 +546,9 @@ class CommandMethodDecorator:
         if self.event_cls_name:
             _check_no_variable_params(self.decorated_method)
 
+        # Define a function that triggers an event, to be bound to aggregates.
+        self.trigger_method = _create_trigger_method(self)
+
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         # Initialised decorator was called directly, presumably by
         # a decorating property that has this decorator as its fset.
@@ -416,10 +559,9 @@ class CommandMethodDecorator:
         assert len(kwargs) == 0
         assert isinstance(args[0], Aggregate)
         aggregate_instance = args[0]
-        bound = BoundCommandMethodDecorator(self, aggregate_instance)
         property_setter_arg_value = args[1]
         kwargs = {self.property_setter_arg_name: property_setter_arg_value}
-        bound.trigger(**kwargs)
+        self.trigger_method(aggregate_instance, **kwargs)
 
     @overload
     def __get__(
@@ -430,21 +572,19 @@ class CommandMethodDecorator:
     @overload
     def __get__(
         self, instance: Aggregate, owner: MetaAggregate[Aggregate]
-    ) -> Union[BoundCommandMethodDecorator, Any]:
+    ) -> Union[MethodType, Any]:
         ...  # pragma: no cover
 
     def __get__(
         self, instance: Optional[Aggregate], owner: MetaAggregate[Aggregate]
-    ) -> Union[
-        BoundCommandMethodDecorator, UnboundCommandMethodDecorator, property, Any
-    ]:
+    ) -> Union[MethodType, UnboundCommandMethodDecorator, property, Any]:
         # If we are decorating a property, then delegate to the property's __get__.
         if self.decorated_property:
             return self.decorated_property.__get__(instance, owner)
 
-        # Return a "bound" command method decorator if we have an instance.
+        # Return the trigger method bound to the instance if we have an instance.
         elif instance:
-            return BoundCommandMethodDecorator(self, instance)
+            return MethodType(self.trigger_method, instance)
 
         # Return an "unbound" command method decorator if we have no instance.
         else:
@@ -453,9 +593,27 @@ class CommandMethodDecorator:
     def __set__(self, instance: Aggregate, value: Any) -> None:
         # Set decorated property indirectly by triggering an event.
         assert self.property_setter_arg_name
-        b = BoundCommandMethodDecorator(self, instance)
         kwargs = {self.property_setter_arg_name: value}
-        b.trigger(**kwargs)
+        self.trigger_method(instance, **kwargs)
+
+
+def _create_trigger_method(
+    event_decorator: CommandMethodDecorator,
+) -> Callable[..., None]:
+    """
+    Returns a function that triggers the event of the given command method
+    decorator. The function looks like the decorated method, so that when
+    bound to an aggregate it has the name, module, and docstring of the
+    decorated method.
+    """
+
+    def trigger(aggregate: Aggregate, *args: Any, **kwargs: Any) -> None:
+        kwargs = _coerce_args_to_kwargs(event_decorator.decorated_method, args, kwargs)
+        event_cls = decorated_event_classes[event_decorator]
+        kwargs = _filter_kwargs_for_method_params(kwargs, event_cls)
+        aggregate.trigger_event(event_cls, **kwargs)
+
+    return wraps(event_decorator.decorated_method)(trigger)
 
 
 # Called when actually decorating something.
@@ -588,41 +746,9 @@ class UnboundCommandMethodDecorator:
         self.__doc__ = event_decorator.decorated_method.__doc__
 
 
-class BoundCommandMethodDecorator:
-    """
-    Wraps an EventDecorator instance when attribute is accessed
-    on an aggregate so that the aggregate methods can be accessed.
-    """
-
-    def __init__(self, event_decorator: CommandMethodDecorator, aggregate: Aggregate):
-        """
-
-        :param CommandMethodDecorator event_decorator:
-        :param Aggregate aggregate:
-        """
-        self.event_decorator = event_decorator
-        self.__module__ = event_decorator.decorated_method.__module__
-        self.__name__ = event_decorator.decorated_method.__name__
-        self.__qualname__ = event_decorator.decorated_method.__qualname__
-        self.__annotations__ = event_decorator.decorated_method.__annotations__
-        self.__doc__ = event_decorator.decorated_method.__doc__
-        self.aggregate = aggregate
-
-    def trigger(self, *args: Any, **kwargs: Any) -> None:
-        kwargs = _coerce_args_to_kwargs(
-            self.event_decorator.decorated_method, args, kwargs
-        )
-        event_cls = decorated_event_classes[self.event_decorator]
-        kwargs = _filter_kwargs_for_method_params(kwargs, event_cls)
-        self.aggregate.trigger_event(event_cls, **kwargs)
-
-    def __call__(self, *args: Any, **kwargs: Any) -> None:
-        self.trigger(*args, **kwargs)
-
-
 given_event_classes: Set[type] = set()
-decorated_methods: Dict[type, CommandMethod] = {}
 aggregate_has_many_created_event_classes: Dict[type, List[str]] = {}
+aggregate_classes: Dict[type, Tuple[str, Type[Aggregate]]] = {}
 
 
 decorated_event_classes: Dict[
@@ -630,8 +756,9 @@ decorated_event_classes: Dict[
 ] = {}
 
 
+@lru_cache(maxsize=None)
 def _check_no_variable_params(method: FunctionType) -> None:
-    for param in inspect.signature(method).parameters.values():
+    for param in _spec_signature(method).parameters.values():
         if param.kind is param.VAR_POSITIONAL:
             raise TypeError(
                 f"*{param.name} not supported by decorator on {method.__name__}()"
@@ -655,6 +782,16 @@ def _coerce_args_to_kwargs(
 ) -> Dict[str, Any]:
     assert isinstance(method, (FunctionType, WrapperDescriptorType))
 
+    # Try the coercer generated for the method, which lets the interpreter
+    # bind the args to the method's parameters.
+    coercer = _spec_coercer(method, expects_id)
+    if coercer is not None:
+        try:
+            return coercer(None, *args, **kwargs)
+        except TypeError:
+            pass
+
+    # Otherwise, bind the args here, raising errors with informative messages.
     args = tuple(args)
     enumerated_args_names, keyword_defaults_items = _spec_coerce_args_to_kwargs(
         method=method,
@@ -663,12 +800,57 @@ def _coerce_args_to_kwargs(
         expects_id=expects_id,
     )
 
-    copy_kwargs = dict(kwargs)
-    for i, name in enumerated_args_names:
-        copy_kwargs[name] = args[i]
-    for name, value in keyword_defaults_items:
-        copy_kwargs[name] = value
-    return copy_kwargs
+    return {
+        **kwargs,
+        **{name: args[i] for i, name in enumerated_args_names},
+        **dict(keyword_defaults_items),
+    }
+
+
+@lru_cache(maxsize=None)
+def _spec_coercer(
+    method: Union[FunctionType, WrapperDescriptorType],
+    expects_id: bool,
+) -> Optional[Callable[..., Dict[str, Any]]]:
+    """
+    Generates a function that has the parameters of the given method, and
+    which returns the values of its arguments as a dict, including default
+    values for optional parameters that were not given.
+
+    Keyword-only parameters are required, because that's how
+    _spec_coerce_args_to_kwargs() treats them.
+
+    Returns None if the parameter names are not unique, for example when
+    an 'id' parameter is expected and the method also has one, in which
+    case the args are bound by _coerce_args_to_kwargs().
+    """
+    (
+        positional_names,
+        required_positional,
+        defaults,
+        required_keyword_only,
+    ) = _spec_method_params(method, expects_id)
+    all_names = positional_names + required_keyword_only
+    if len(set(all_names)) != len(all_names):
+        return None
+    keyword_defaults = dict(defaults)
+    namespace: Dict[str, Any] = {}
+    params = ["__self__"]
+    for i, name in enumerate(positional_names):
+        if name in required_positional:
+            params.append(name)
+        else:
+            namespace[f"__default_{i}__"] = keyword_defaults[name]
+            params.append(f"{name}=__default_{i}__")
+    if required_keyword_only:
+        params.append("*")
+        params.extend(required_keyword_only)
+    items = [f"{name!r}: {name}" for name in all_names]
+    source = (
+        f"def __coerce__({', '.join(params)}):\n" f"    return {{{', '.join(items)}}}\n"
+    )
+    exec(source, namespace)
+    return cast(Callable[..., Dict[str, Any]], namespace["__coerce__"])
 
 
 @lru_cache(maxsize=None)
@@ -678,26 +860,13 @@ def _spec_coerce_args_to_kwargs(
     kwargs_keys: Tuple[str],
     expects_id: bool,
 ) -> Tuple[Tuple[Tuple[int, str], ...], Tuple[Tuple[str, Any], ...]]:
-    method_signature = inspect.signature(method)
-    positional_names = []
-    keyword_defaults = {}
-    required_positional = []
-    required_keyword_only = []
-    if expects_id:
-        positional_names.append("id")
-        required_positional.append("id")
-    for name, param in method_signature.parameters.items():
-        if name == "self":
-            continue
-        # elif param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
-        if param.kind is param.KEYWORD_ONLY:
-            required_keyword_only.append(name)
-        if param.kind is param.POSITIONAL_OR_KEYWORD:
-            positional_names.append(name)
-            if param.default == param.empty:
-                required_positional.append(name)
-        if param.default != param.empty:
-            keyword_defaults[name] = param.default
+    (
+        positional_names,
+        required_positional,
+        defaults,
+        required_keyword_only,
+    ) = _spec_method_params(method, expects_id)
+    keyword_defaults = dict(defaults)
     # if not required_keyword_only and not positional_names:
     #     if args or kwargs:
     #         raise TypeError(f"{method.__name__}() takes no args")
@@ -759,6 +928,69 @@ def _spec_coerce_args_to_kwargs(
     return enumerated_args_names, keyword_defaults_items
 
 
+@lru_cache(maxsize=None)
+def _spec_method_params(
+    method: Union[FunctionType, WrapperDescriptorType],
+    expects_id: bool,
+) -> Tuple[
+    Tuple[str, ...], Tuple[str, ...], Tuple[Tuple[str, Any], ...], Tuple[str, ...]
+]:
+    """
+    Returns the names of the positional parameters, the names of the
+    required positional parameters, the defaults of the parameters that
+    have defaults, and the names of the keyword-only parameters of the
+    given method. The method signature is inspected only once per method.
+    """
+    method_signature = _spec_signature(method)
+    positional_names = []
+    keyword_defaults = {}
+    required_positional = []
+    required_keyword_only = []
+    if expects_id:
+        positional_names.append("id")
+        required_positional.append("id")
+    for name, param in method_signature.parameters.items():
+        if name == "self":
+            continue
+        # elif param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+        if param.kind is param.KEYWORD_ONLY:
+            required_keyword_only.append(name)
+        if param.kind is param.POSITIONAL_OR_KEYWORD:
+            positional_names.append(name)
+            if param.default == param.empty:
+                required_positional.append(name)
+        if param.default != param.empty:
+            keyword_defaults[name] = param.default
+    return (
+        tuple(positional_names),
+        tuple(required_positional),
+        tuple(keyword_defaults.items()),
+        tuple(required_keyword_only),
+    )
+
+
+@lru_cache(maxsize=None)
+def _spec_event_class_params(
+    apply_method: CommandMethod,
+) -> Tuple[Tuple[str, Any, bool], ...]:
+    """
+    Returns the name, annotation, and whether or not there is a default value,
+    of each parameter of the given method that may define an event attribute.
+    """
+    method_signature = _spec_signature(apply_method)
+    params = []
+    for param_name, param in list(method_signature.parameters.items())[1:]:
+        # Don't define 'id' on a "created" class.
+        if param_name == "id" and apply_method.__name__ == "__init__":
+            continue
+        if param.annotation is param.empty:
+            annotation = Any
+        else:
+            annotation = param.annotation
+        params.append((param_name, annotation, param.default != param.empty))
+    return tuple(params)
+
+
 def _raise_missing_names_type_error(missing_names: List[str], msg: str) -> None:
     msg += missing_names[0]
     if len(missing_names) == 2:
@@ -791,6 +1023,8 @@ class MetaAggregate(type, Generic[TAggregate]):
         pass
 
     class DecoratedEvent(CanMutateAggregate):
+        _decorated_method: ClassVar[CommandMethod]
+
         def apply(self, aggregate: Aggregate) -> None:
             """
             Applies event to aggregate by calling method decorated by @event.
@@ -799,7 +1033,19 @@ class MetaAggregate(type, Generic[TAggregate]):
             super().apply(aggregate)
 
             # Identify the method that was decorated.
-            decorated_method = decorated_methods[type(self)]
+            decorated_method = type(self)._decorated_method
+
+            # Get values of event attributes as positional args, if possible.
+            args_getter = _spec_positional_args_getter(decorated_method)
+            if args_getter is not None:
+                try:
+                    args = args_getter(self.__dict__)
+                except KeyError:
+                    pass
+                else:
+                    # Call the original method with event attribute values.
+                    decorated_method(aggregate, *args)
+                    return
 
             # Select event attributes mentioned in method signature.
             kwargs = _filter_kwargs_for_method_params(self.__dict__, decorated_method)
@@ -936,7 +1182,7 @@ class MetaAggregate(type, Generic[TAggregate]):
 
         # Todo: Write a test to cover this when "Created" class is explicitly defined.
         # Check if init mentions ID.
-        for param_name in inspect.signature(cls.__init__).parameters:  # type: ignore
+        for param_name in _spec_signature(cls.__init__).parameters:  # type: ignore
             if param_name == "id":
                 _init_mentions_id.add(cls)
                 break
@@ -1016,7 +1262,7 @@ class MetaAggregate(type, Generic[TAggregate]):
             ):
                 event_decorator = attr_value.fset
                 # Inspect the setter method.
-                method_signature = inspect.signature(event_decorator.decorated_method)
+                method_signature = _spec_signature(event_decorator.decorated_method)
                 assert len(method_signature.parameters) == 2
                 event_decorator.is_property_setter = True
                 event_decorator.property_setter_arg_name = list(
@@ -1076,7 +1322,9 @@ class MetaAggregate(type, Generic[TAggregate]):
                     )
 
                 # Cache the decorated method for the event class to use.
-                decorated_methods[event_cls] = event_decorator.decorated_method
+                setattr(
+                    event_cls, "_decorated_method", event_decorator.decorated_method
+                )
 
                 # Set the event class as an attribute of the aggregate class.
                 setattr(cls, event_cls.__name__, event_cls)
@@ -1095,10 +1343,11 @@ class MetaAggregate(type, Generic[TAggregate]):
                 )
 
         # Get the parameters of the create_id method that will be used by this class.
-        cls._create_id_param_names: List[str] = []
+        create_id_param_names = []
         for name, param in inspect.signature(cls.create_id).parameters.items():
             if param.kind in [param.KEYWORD_ONLY, param.POSITIONAL_OR_KEYWORD]:
-                cls._create_id_param_names.append(name)
+                create_id_param_names.append(name)
+        cls._create_id_param_names: FrozenSet[str] = frozenset(create_id_param_names)
 
         # Define event classes for all events on bases.
         for aggregate_base_class in args[1]:
@@ -1123,18 +1372,16 @@ class MetaAggregate(type, Generic[TAggregate]):
         # Define annotations for the event class (specs the init method).
         annotations = {}
         if apply_method is not None:
-            method_signature = inspect.signature(apply_method)
             supers = {
                 s for b in bases for s in b.__mro__ if hasattr(s, "__annotations__")
             }
             super_annotations = {a for s in supers for a in s.__annotations__}
-            for param_name, param in list(method_signature.parameters.items())[1:]:
-                # Don't define 'id' on a "created" class.
-                if param_name == "id" and apply_method.__name__ == "__init__":
-                    continue
+            for param_name, annotation, has_default in _spec_event_class_params(
+                apply_method
+            ):
                 # Don't override super class annotations, unless no default on param.
-                if param_name not in super_annotations or param.default == param.empty:
-                    annotations[param_name] = param.annotation or "typing.Any"
+                if param_name not in super_annotations or not has_default:
+                    annotations[param_name] = annotation
         event_cls_qualname = ".".join([cls.__qualname__, name])
         event_cls_dict = {
             "__annotations__": annotations,
@@ -1203,10 +1450,14 @@ class Aggregate(metaclass=MetaAggregate):
         """
         # Construct the domain event with an ID and a
         # version, and a topic for the aggregate class.
-        create_id_kwargs = {
-            k: v for k, v in kwargs.items() if k in cls._create_id_param_names
-        }
-        originator_id = id or cls.create_id(**create_id_kwargs)
+        if id:
+            originator_id = id
+        else:
+            # Select the values mentioned in the create_id() signature.
+            create_id_kwargs = {
+                k: kwargs[k] for k in cls._create_id_param_names if k in kwargs
+            }
+            originator_id = cls.create_id(**create_id_kwargs)
 
         # Impose the required common "created" event attribute values.
         kwargs = kwargs.copy()
@@ -1294,7 +1545,16 @@ class Aggregate(metaclass=MetaAggregate):
         pass
 
     def __eq__(self, other: Any) -> bool:
-        return type(self) == type(other) and self.__dict__ == other.__dict__
+        if type(self) is not type(other):
+            return False
+        # Compare ID and version first, since they usually differ.
+        if self._id != other._id or self._version != other._version:
+            return False
+        # Compare other attributes, except the transient pending events.
+        self_dict, other_dict = self.__dict__, other.__dict__
+        return self_dict.keys() == other_dict.keys() and all(
+            v == other_dict[k] for k, v in self_dict.items() if k != "_pending_events"
+        )
 
     def __repr__(self) -> str:
         attrs = [
@@ -1319,12 +1579,12 @@ class Aggregate(metaclass=MetaAggregate):
         next_version = self.version + 1
 
         # Impose the required common domain event attribute values.
-        kwargs = kwargs.copy()
-        kwargs.update(
-            originator_id=self.id,
-            originator_version=next_version,
-            timestamp=event_class.create_timestamp(),
-        )
+        kwargs = {
+            **kwargs,
+            "originator_id": self.id,
+            "originator_version": next_version,
+            "timestamp": event_class.create_timestamp(),
+        }
         try:
             new_event = event_class(**kwargs)
         except TypeError as e:
@@ -1335,14 +1595,24 @@ class Aggregate(metaclass=MetaAggregate):
         # Append the domain event to pending list.
         self._pending_events.append(new_event)
 
+    def trigger_events(
+        self,
+        events: Iterable[Tuple[Type[CanMutateAggregate], Dict[str, Any]]],
+    ) -> None:
+        """
+        Triggers domain events of given types, with given keyword
+        arguments, in order. The events have the same timestamp.
+        """
+        with batch_timestamps():
+            for event_class, kwargs in events:
+                self.trigger_event(event_class, **kwargs)
+
     def collect_events(self) -> Sequence[CanMutateAggregate]:
         """
         Collects and returns a list of pending aggregate
         :class:`AggregateEvent` objects.
         """
-        collected = []
-        while self._pending_events:
-            collected.append(self._pending_events.pop(0))
+        collected, self._pending_events = self._pending_events, []
         return collected
 
 
@@ -1381,6 +1651,18 @@ def aggregate(
     def decorator(cls_: Any) -> Type[Aggregate]:
         if issubclass(cls_, Aggregate):
             raise TypeError(f"{cls_.__qualname__} is already an Aggregate")
+        # Return the aggregate class if this class was already decorated.
+        try:
+            decorated_name, decorated_cls = aggregate_classes[cls_]
+        except KeyError:
+            pass
+        else:
+            if decorated_name != created_event_name:
+                raise TypeError(
+                    f"{cls_.__qualname__} is already decorated with "
+                    f"created_event_name {decorated_name!r}"
+                )
+            return decorated_cls
         bases = cls_.__bases__
         if bases == (object,):
             bases = (Aggregate,)
@@ -1388,14 +1670,15 @@ def aggregate(
             bases += (Aggregate,)
         cls_dict = dict()
         cls_dict.update(cls_.__dict__)
-        cls_ = MetaAggregate(
+        aggregate_cls = MetaAggregate(
             cls_.__qualname__,
             bases,
             cls_dict,
             created_event_name=created_event_name,
         )
-        assert issubclass(cls_, Aggregate)
-        return cls_
+        assert issubclass(aggregate_cls, Aggregate)
+        aggregate_classes[cls_] = (created_event_name, aggregate_cls)
+        return aggregate_cls
 
     if cls:
         return decorator(cls)
@@ -1449,6 +1732,10 @@ class SnapshotProtocol(DomainEventProtocol, Protocol):
 TCanSnapshotAggregate = TypeVar("TCanSnapshotAggregate", bound="CanSnapshotAggregate")
 
 
+# Attributes of Aggregate objects that are not included in snapshot state.
+_SNAPSHOT_EXCLUDED = frozenset(["_id", "_version", "_pending_events"])
+
+
 class CanSnapshotAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
     topic: str
     state: Dict[str, Any]
@@ -1461,17 +1748,23 @@ class CanSnapshotAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
         """
         Creates a snapshot of the given :class:`Aggregate` object.
         """
-        aggregate_state = dict(aggregate.__dict__)
+        aggregate_dict = aggregate.__dict__
+        if isinstance(aggregate, Aggregate):
+            aggregate_state = {
+                k: v for k, v in aggregate_dict.items() if k not in _SNAPSHOT_EXCLUDED
+            }
+            originator_id = aggregate_dict["_id"]
+            originator_version = aggregate_dict["_version"]
+        else:
+            aggregate_state = dict(aggregate_dict)
+            originator_id = aggregate.id
+            originator_version = aggregate.version
         class_version = getattr(type(aggregate), "class_version", 1)
         if class_version > 1:
             aggregate_state["class_version"] = class_version
-        if isinstance(aggregate, Aggregate):
-            aggregate_state.pop("_id")
-            aggregate_state.pop("_version")
-            aggregate_state.pop("_pending_events")
         snapshot = cls(  # type: ignore
-            originator_id=aggregate.id,
-            originator_version=aggregate.version,
+            originator_id=originator_id,
+            originator_version=originator_version,
             timestamp=cls.create_timestamp(),
             topic=get_topic(type(aggregate)),
             state=aggregate_state,
@@ -1485,18 +1778,15 @@ class CanSnapshotAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
         cls = cast(Type[Aggregate], resolve_topic(self.topic))
         aggregate_state = dict(self.state)
         from_version = aggregate_state.pop("class_version", 1)
-        class_version = getattr(cls, "class_version", 1)
-        while from_version < class_version:
-            upcast_name = f"upcast_v{from_version}_v{from_version + 1}"
-            upcast = getattr(cls, upcast_name)
+        for upcast in get_upcasts(cls, from_version):
             upcast(aggregate_state)
-            from_version += 1
 
         aggregate_state["_id"] = self.originator_id
         aggregate_state["_version"] = self.originator_version
         aggregate_state["_pending_events"] = []
         aggregate = object.__new__(cls)
-        aggregate.__dict__.update(aggregate_state)
+        # The state dict is a copy, so the aggregate can use it as its __dict__.
+        aggregate.__dict__ = aggregate_state
         return aggregate
 
 
@@ -1,11 +1,14 @@
 import json
 import uuid
+import weakref
 from abc import ABC, abstractmethod
 from collections import deque
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, fields
 from datetime import datetime
 from decimal import Decimal
-from threading import Condition, Event, Lock, Semaphore, Timer
+from queue import Empty, Queue
+from threading import Condition, Event, Lock, Semaphore, Thread, Timer
 from time import time
 from types import ModuleType
 from typing import (
@@ -17,6 +20,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -30,6 +34,7 @@ from eventsourcing.utils import (
     Environment,
     TopicError,
     get_topic,
+    get_upcasts,
     resolve_topic,
     strtobool,
 )
@@ -206,11 +211,21 @@ class StoredEvent:
     :param bytes state: serialised state of the domain event object
     """
 
+    __slots__ = ("originator_id", "originator_version", "topic", "state")
+
     originator_id: uuid.UUID
     originator_version: int
     topic: str
     state: bytes
 
+    def __getstate__(self) -> List[Any]:
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        # Frozen, so can't use setattr().
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+
 
 class Compressor(ABC):
     """
@@ -316,11 +331,9 @@ class Mapper:
         event_state["originator_id"] = stored_event.originator_id
         event_state["originator_version"] = stored_event.originator_version
         cls = resolve_topic(stored_event.topic)
-        class_version = getattr(cls, "class_version", 1)
         from_version = event_state.pop("class_version", 1)
-        while from_version < class_version:
-            getattr(cls, f"upcast_v{from_version}_v{from_version + 1}")(event_state)
-            from_version += 1
+        for upcast in get_upcasts(cls, from_version):
+            upcast(event_state)
 
         domain_event = object.__new__(cls)
         domain_event.__dict__.update(event_state)
@@ -437,6 +450,8 @@ class Notification(StoredEvent):
     Frozen dataclass that represents domain event notifications.
     """
 
+    __slots__ = ("id",)
+
     id: int
 
 
@@ -458,11 +473,14 @@ class ApplicationRecorder(AggregateRecorder):
         limit: int,
         stop: Optional[int] = None,
         topics: Sequence[str] = (),
+        include_state: bool = True,
     ) -> List[Notification]:
         """
         Returns a list of event notifications
         from 'start', limited by 'limit' and
-        optionally by 'stop'.
+        optionally by 'stop'. If 'include_state'
+        is false, the state of the event notifications
+        is not selected, and is empty.
         """
 
     @abstractmethod
@@ -499,6 +517,165 @@ class ProcessRecorder(ApplicationRecorder):
         """
 
 
+_BatchedInsert = Tuple[List[StoredEvent], "Future[Optional[Sequence[int]]]"]
+
+
+class RecorderProxyClosed(EventSourcingError):
+    """
+    Raised when inserting events with a recorder proxy that is already closed.
+    """
+
+
+class BatchingRecorderProxy(ApplicationRecorder):
+    """
+    Application recorder that combines the stored events of concurrent
+    calls to :func:`insert_events` into a single call to the
+    application recorder it wraps, so that many small writes are
+    committed in one transaction ("group commit").
+
+    Calls are queued, and a committer thread takes up to
+    ``max_batch_size`` queued calls, waiting no longer than ``max_linger``
+    seconds for further calls after the first. Each caller is returned
+    the notification IDs of its own stored events. If inserting a batch
+    fails, the calls in the batch are retried individually, so that only
+    the calls which actually conflict raise an exception.
+
+    Calls with keyword arguments (e.g. tracking) are not combined with
+    other calls, and are passed directly to the wrapped recorder.
+
+    The proxy should be closed when it is no longer needed. The committer
+    thread doesn't refer to the proxy, so that the thread is also stopped
+    if an unclosed proxy is garbage collected.
+    """
+
+    def __init__(
+        self,
+        recorder: ApplicationRecorder,
+        max_batch_size: int = 500,
+        max_linger: float = 0.002,
+    ):
+        self.recorder = recorder
+        self.max_batch_size = max_batch_size
+        self.max_linger = max_linger
+        self._queue: "Queue[Optional[_BatchedInsert]]" = Queue()
+        self._close_lock = Lock()
+        self._is_closed = False
+        self._committer_thread = Thread(
+            target=self._commit_batches,
+            args=(self._queue, recorder, max_batch_size, max_linger),
+            daemon=True,
+        )
+        self._committer_thread.start()
+        self._stop_committer = weakref.finalize(self, self._queue.put, None)
+
+    def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Optional[Sequence[int]]:
+        if kwargs:
+            return self.recorder.insert_events(stored_events, **kwargs)
+        future: "Future[Optional[Sequence[int]]]" = Future()
+        with self._close_lock:
+            if self._is_closed:
+                raise RecorderProxyClosed("Recorder proxy is closed")
+            self._queue.put((stored_events, future))
+        return future.result()
+
+    def select_events(
+        self,
+        originator_id: UUID,
+        gt: Optional[int] = None,
+        lte: Optional[int] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[StoredEvent]:
+        return self.recorder.select_events(
+            originator_id, gt=gt, lte=lte, desc=desc, limit=limit
+        )
+
+    def select_notifications(
+        self,
+        start: int,
+        limit: int,
+        stop: Optional[int] = None,
+        topics: Sequence[str] = (),
+        include_state: bool = True,
+    ) -> List[Notification]:
+        return self.recorder.select_notifications(
+            start, limit, stop=stop, topics=topics, include_state=include_state
+        )
+
+    def max_notification_id(self) -> int:
+        return self.recorder.max_notification_id()
+
+    def close(self) -> None:
+        """
+        Stops the committer thread, after queued calls have been committed.
+        Subsequent calls to :func:`insert_events` without keyword arguments
+        raise :class:`RecorderProxyClosed`.
+        """
+        with self._close_lock:
+            self._is_closed = True
+            self._stop_committer()
+        self._committer_thread.join()
+
+    @staticmethod
+    def _commit_batches(
+        queue: "Queue[Optional[_BatchedInsert]]",
+        recorder: ApplicationRecorder,
+        max_batch_size: int,
+        max_linger: float,
+    ) -> None:
+        is_stopping = False
+        while not is_stopping:
+            item = queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time() + max_linger
+            while len(batch) < max_batch_size:
+                try:
+                    item = queue.get(timeout=max(deadline - time(), 0))
+                except Empty:
+                    break
+                if item is None:
+                    is_stopping = True
+                    break
+                batch.append(item)
+            BatchingRecorderProxy._commit_batch(recorder, batch)
+
+        # Fail any calls that are still queued, so that callers don't wait forever.
+        while True:
+            try:
+                item = queue.get_nowait()
+            except Empty:
+                break
+            if item is not None:
+                item[1].set_exception(RecorderProxyClosed("Recorder proxy is closed"))
+
+    @staticmethod
+    def _commit_batch(
+        recorder: ApplicationRecorder, batch: List[_BatchedInsert]
+    ) -> None:
+        stored_events = [s for stored_events, _ in batch for s in stored_events]
+        try:
+            notification_ids = recorder.insert_events(stored_events)
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+            else:
+                for item in batch:
+                    BatchingRecorderProxy._commit_batch(recorder, [item])
+        else:
+            start = 0
+            for stored_events, future in batch:
+                if notification_ids is None:
+                    future.set_result(None)
+                else:
+                    end = start + len(stored_events)
+                    future.set_result(notification_ids[start:end])
+                    start = end
+
+
 @dataclass(frozen=True)
 class Recording:
     domain_event: DomainEventProtocol
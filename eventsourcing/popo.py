@@ -104,6 +104,7 @@ class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
         limit: int,
         stop: Optional[int] = None,
         topics: Sequence[str] = (),
+        include_state: bool = True,
     ) -> List[Notification]:
         with self._database_lock:
             results = []
@@ -123,7 +124,7 @@ class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
                     originator_id=s.originator_id,
                     originator_version=s.originator_version,
                     topic=s.topic,
-                    state=s.state,
+                    state=s.state if include_state else b"",
                 )
                 results.append(n)
                 if len(results) == limit:
@@ -574,6 +574,7 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
         limit: int,
         stop: Optional[int] = None,
         topics: Sequence[str] = (),
+        include_state: bool = True,
     ) -> List[Notification]:
         """
         Returns a list of event notifications
@@ -581,12 +582,20 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
         """
 
         params: List[Union[int, str, Sequence[str]]] = [start]
+        if include_state:
+            columns = "*"
+        else:
+            columns = "notification_id, originator_id, originator_version, topic"
         statement = (
-            "SELECT * " f"FROM {self.events_table_name} " "WHERE notification_id>=$1 "
+            f"SELECT {columns} "
+            f"FROM {self.events_table_name} "
+            "WHERE notification_id>=$1 "
         )
         statement_name = f"select_notifications_{self.events_table_name}".replace(
             ".", "_"
         )
+        if not include_state:
+            statement_name += "_no_state"
 
         if stop is not None:
             params.append(stop)
@@ -620,7 +629,7 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
                             originator_id=row["originator_id"],
                             originator_version=row["originator_version"],
                             topic=row["topic"],
-                            state=bytes(row["state"]),
+                            state=bytes(row["state"]) if include_state else b"",
                         )
                     )
                 pass  # for Coverage 5.5 bug with CPython 3.10.0rc1
@@ -375,19 +375,20 @@ class SQLiteApplicationRecorder(
         stored_events: List[StoredEvent],
         **kwargs: Any,
     ) -> Optional[Sequence[int]]:
-        returning = []
-        for stored_event in stored_events:
-            c.execute(
-                self.insert_events_statement,
-                (
-                    stored_event.originator_id.hex,
-                    stored_event.originator_version,
-                    stored_event.topic,
-                    stored_event.state,
-                ),
+        super()._insert_events(c, stored_events, **kwargs)
+        if stored_events:
+            # Rows inserted in a write transaction have consecutive rowids.
+            c.execute("SELECT last_insert_rowid()")
+            last_notification_id = c.fetchone()[0]
+            notification_ids = list(
+                range(
+                    last_notification_id - len(stored_events) + 1,
+                    last_notification_id + 1,
+                )
             )
-            returning.append(c.lastrowid)
-        return returning
+        else:
+            notification_ids = []
+        return notification_ids
 
     def select_notifications(
         self,
@@ -395,6 +396,7 @@ class SQLiteApplicationRecorder(
         limit: int,
         stop: Optional[int] = None,
         topics: Sequence[str] = (),
+        include_state: bool = True,
     ) -> List[Notification]:
         """
         Returns a list of event notifications
@@ -403,7 +405,11 @@ class SQLiteApplicationRecorder(
         notifications = []
 
         params: List[Union[int, str]] = [start]
-        statement = f"SELECT rowid, * FROM {self.events_table_name} " "WHERE rowid>=? "
+        if include_state:
+            columns = "rowid, *"
+        else:
+            columns = "rowid, originator_id, originator_version, topic"
+        statement = f"SELECT {columns} FROM {self.events_table_name} WHERE rowid>=? "
 
         if stop is not None:
             params.append(stop)
@@ -426,7 +432,7 @@ class SQLiteApplicationRecorder(
                         originator_id=UUID(row["originator_id"]),
                         originator_version=row["originator_version"],
                         topic=row["topic"],
-                        state=row["state"],
+                        state=row["state"] if include_state else b"",
                     )
                 )
             pass  # for Coverage 5.5 bug with CPython 3.10.0rc1
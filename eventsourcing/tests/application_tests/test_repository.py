@@ -3,8 +3,14 @@ from functools import reduce
 from unittest.case import TestCase
 from uuid import uuid4
 
-from eventsourcing.application import AggregateNotFound, Cache, LRUCache, Repository
-from eventsourcing.domain import Aggregate, Snapshot
+from eventsourcing.application import (
+    AggregateNotFound,
+    Cache,
+    LRUCache,
+    Repository,
+    project_aggregate_trusted,
+)
+from eventsourcing.domain import Aggregate, OriginatorVersionError, Snapshot
 from eventsourcing.persistence import (
     DatetimeAsISO,
     DecimalAsStr,
@@ -200,6 +206,56 @@ class TestRepository(TestCase):
         assert isinstance(copy7, BankAccount)
         assert copy7.balance == Decimal("65.00"), copy7.balance
 
+    def test_with_trusted_projector_function(self):
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DecimalAsStr())
+        transcoder.register(DatetimeAsISO())
+        transcoder.register(EmailAddressAsStr())
+
+        event_recorder = SQLiteAggregateRecorder(SQLiteDatastore(":memory:"))
+        event_recorder.create_table()
+        event_store = EventStore(
+            mapper=Mapper(transcoder=transcoder),
+            recorder=event_recorder,
+        )
+        repository = Repository(event_store)
+
+        # Open an account.
+        account = BankAccount.open(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+
+        # Credit the account.
+        account.append_transaction(Decimal("10.00"))
+        account.append_transaction(Decimal("25.00"))
+        account.append_transaction(Decimal("30.00"))
+
+        # Store pending events.
+        pending = account.collect_events()
+        event_store.put(pending)
+
+        copy = repository.get(account.id, projector_func=project_aggregate_trusted)
+        assert isinstance(copy, BankAccount)
+        # Check copy has correct attribute values.
+        assert copy.id == account.id
+        assert copy.balance == Decimal("65.00")
+        assert copy.version == 4
+        assert copy.modified_on == pending[-1].timestamp
+
+        # Check the first event is checked.
+        with self.assertRaises(OriginatorVersionError):
+            project_aggregate_trusted(copy, pending[1:])
+
+        # Check subsequent events are applied.
+        copy = repository.get(
+            account.id, version=2, projector_func=project_aggregate_trusted
+        )
+        copy = project_aggregate_trusted(copy, pending[2:])
+        assert copy.balance == Decimal("65.00")
+        assert copy.version == 4
+
     def test_with_alternative_mutator_function(self):
         def mutator(initial, domain_events):
             return reduce(lambda a, e: e.mutate(a), domain_events, initial)
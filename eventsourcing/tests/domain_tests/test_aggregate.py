@@ -820,6 +820,21 @@ class TestAggregateCreation(TestCase):
         index = Index(name=name, id=index_id)
         self.assertEqual(index.id, index_id)
 
+    def test_id_annotation_and_init_has_id(self):
+        class Index(Aggregate):
+            id: UUID
+
+            def __init__(self, id: UUID, name: str = "name"):
+                self.name = name
+
+        with self.assertRaises(TypeError) as cm:
+            Index(uuid4())
+        self.assertEqual(
+            cm.exception.args[0],
+            f"{get_method_name(Index.__init__)}() missing 1 "
+            f"required positional argument: 'id'",
+        )
+
 
 class TestSubsequentEvents(TestCase):
     def test_trigger_event(self):
@@ -836,6 +851,31 @@ class TestSubsequentEvents(TestCase):
         self.assertIsInstance(pending[1], AggregateEvent)
         self.assertEqual(pending[1].originator_version, 2)
 
+    def test_trigger_events(self):
+        class MyAgg(Aggregate):
+            class ValueUpdated(AggregateEvent):
+                value: int
+
+                def apply(self, aggregate):
+                    aggregate.value = self.value
+
+        a = MyAgg()
+        a.trigger_events(
+            [
+                (MyAgg.ValueUpdated, {"value": 1}),
+                (MyAgg.ValueUpdated, {"value": 2}),
+                (AggregateEvent, {}),
+            ]
+        )
+        self.assertEqual(a.version, 4)
+        self.assertEqual(a.value, 2)
+
+        pending = a.collect_events()
+        self.assertEqual([e.originator_version for e in pending], [1, 2, 3, 4])
+        self.assertEqual(pending[1].timestamp, pending[2].timestamp)
+        self.assertEqual(pending[1].timestamp, pending[3].timestamp)
+        self.assertEqual(a.modified_on, pending[3].timestamp)
+
     def test_event_mutate_raises_originator_version_error(self):
         a = Aggregate()
 
@@ -956,6 +996,16 @@ class TestSubsequentEvents(TestCase):
         a.collect_events()
         self.assertNotEqual(a, a_copy)
 
+    def test_eq_ignores_pending_events(self):
+        a = Aggregate()
+        a_copy = a.pending_events[0].mutate(None)
+        self.assertEqual(len(a.pending_events), 1)
+        self.assertEqual(len(a_copy.pending_events), 0)
+        self.assertEqual(a, a_copy)
+
+        a_copy.foo = "bar"
+        self.assertNotEqual(a, a_copy)
+
     def test_repr_baseclass(self):
         a = Aggregate()
 
@@ -1,5 +1,7 @@
+import inspect
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, get_type_hints
 from unittest import TestCase
 
 from eventsourcing.application import Application
@@ -135,6 +137,39 @@ class TestAggregateDecorator(TestCase):
         self.assertEqual(len(a.pending_events), 1)
         self.assertEqual(type(a.pending_events[0]).__name__, "Started")
 
+    def test_aggregate_decorator_returns_same_class_when_called_again(self):
+        class MyClass:
+            @event("ValueUpdated")
+            def update_value(self, value: int):
+                self.value = value
+
+        MyAgg = aggregate(MyClass)
+        self.assertIs(aggregate(MyClass), MyAgg)
+
+        a = MyAgg()
+        a.update_value(1)
+        self.assertIsInstance(a.pending_events[1], MyAgg.ValueUpdated)
+
+    def test_aggregate_decorator_raises_type_error_if_created_event_name_differs(
+        self,
+    ):
+        class MyClass:
+            @event("ValueUpdated")
+            def update_value(self, value: int):
+                self.value = value
+
+        MyAgg = aggregate(MyClass)
+        with self.assertRaises(TypeError) as cm:
+            aggregate(MyClass, created_event_name="Started")
+        self.assertEqual(
+            cm.exception.args[0],
+            f"{MyClass.__qualname__} is already decorated with created_event_name ''",
+        )
+
+        a = MyAgg()
+        a.update_value(1)
+        self.assertIsInstance(a.pending_events[1], MyAgg.ValueUpdated)
+
 
 class TestEventDecorator(TestCase):
     def test_event_name_inferred_from_method_no_args(self):
@@ -151,6 +186,15 @@ class TestEventDecorator(TestCase):
         self.assertEqual(len(a.pending_events), 2)
         self.assertIsInstance(a.pending_events[1], MyAgg.Heartbeat)
 
+    def test_unannotated_params_are_annotated_any(self):
+        class MyAgg(Aggregate):
+            @event("ValueSet")
+            def set_value(self, value):
+                self.value = value
+
+        type_hints = get_type_hints(MyAgg.ValueSet)
+        self.assertIs(type_hints["value"], Any)
+
     def test_event_decorator_called_without_args(self):
         class MyAgg(Aggregate):
             @event()
@@ -1409,6 +1453,37 @@ class TestEventDecorator(TestCase):
             cm.exception.args[0],
         )
 
+    def test_apply_method_params_not_mentioned_by_given_event_class(self):
+        class MyAggregate(Aggregate):
+            class ValuesSet(Aggregate.Event):
+                a: int
+
+            @event(ValuesSet)
+            def set_values(self, a: int, b: int = 2):
+                self.a = a
+                self.b = b
+
+            class OtherValuesSet(Aggregate.Event):
+                a: int
+                c: int
+
+            @event(OtherValuesSet)
+            def set_other_values(self, a: int, b: int = 4, *, c: int):
+                self.a = a
+                self.b = b
+                self.c = c
+
+        a = MyAggregate()
+        a.set_values(1)
+        self.assertEqual((a.a, a.b), (1, 2))
+        a.set_other_values(3, c=5)
+        self.assertEqual((a.a, a.b, a.c), (3, 4, 5))
+
+        copy = None
+        for e in a.collect_events():
+            copy = e.mutate(copy)
+        self.assertEqual((copy.a, copy.b, copy.c), (3, 4, 5))
+
     def test_decorated_method_has_original_docstring(self):
         class MyAggregate(Aggregate):
             def method0(self):
@@ -1467,6 +1542,16 @@ class TestEventDecorator(TestCase):
         self.assertEqual(MyAggregate.method1.__name__, "method1")
         self.assertEqual(MyAggregate().method1.__name__, "method1")
 
+    def test_decorated_method_has_original_doc_and_signature(self):
+        class MyAggregate(Aggregate):
+            @event
+            def method1(self, a: int):
+                """Method 1"""
+
+        a = MyAggregate()
+        self.assertEqual(a.method1.__doc__, "Method 1")
+        self.assertEqual(str(inspect.signature(a.method1)), "(a: int)")
+
     # def test_raises_when_apply_method_returns_value(self):
     #     # Different name.
     #     class MyAgg(Aggregate):
@@ -1,10 +1,11 @@
-from dataclasses import _DataclassParams
+from dataclasses import FrozenInstanceError, _DataclassParams, field
 from datetime import datetime, timezone
 from time import sleep
+from typing import List
 from unittest.case import TestCase
 from uuid import UUID, uuid4
 
-from eventsourcing.domain import DomainEvent, MetaDomainEvent
+from eventsourcing.domain import DomainEvent, MetaDomainEvent, batch_timestamps
 
 
 class TestMetaDomainEvent(TestCase):
@@ -17,6 +18,43 @@ class TestMetaDomainEvent(TestCase):
         self.assertIsInstance(A.__dataclass_params__, _DataclassParams)
         self.assertTrue(A.__dataclass_params__.frozen)
 
+    def test_instances_initialised_with_defaults_and_post_init(self):
+        class A(metaclass=MetaDomainEvent):
+            a: int
+            b: int = 2
+            c: List[int] = field(default_factory=list)
+
+            def __post_init__(self) -> None:
+                self.__dict__["d"] = self.a + self.b
+
+        a = A(1)
+        self.assertEqual(a.a, 1)
+        self.assertEqual(a.b, 2)
+        self.assertEqual(a.c, [])
+        self.assertEqual(a.d, 3)
+        self.assertIsNot(a.c, A(1).c)
+
+        a = A(a=1, b=3, c=[4])
+        self.assertEqual(a.b, 3)
+        self.assertEqual(a.c, [4])
+        self.assertEqual(a.d, 4)
+
+        with self.assertRaises(TypeError):
+            A()
+
+        with self.assertRaises(FrozenInstanceError):
+            a.a = 2  # type: ignore
+
+    def test_init_method_defined_on_class_is_not_replaced(self):
+        class A(metaclass=MetaDomainEvent):
+            x: int
+
+            def __init__(self, x: int) -> None:
+                object.__setattr__(self, "x", x * 10)
+
+        a = A(2)
+        self.assertEqual(a.x, 20)
+
 
 class TestDomainEvent(TestCase):
     def test_domain_event_class_is_a_meta_domain_event(self):
@@ -31,6 +69,16 @@ class TestDomainEvent(TestCase):
         self.assertGreater(timestamp, before)
         self.assertGreater(after, timestamp)
 
+    def test_batch_timestamps(self):
+        with batch_timestamps() as timestamp:
+            sleep(1e-5)
+            self.assertEqual(DomainEvent.create_timestamp(), timestamp)
+            sleep(1e-5)
+            self.assertEqual(DomainEvent.create_timestamp(), timestamp)
+
+        sleep(1e-5)
+        self.assertGreater(DomainEvent.create_timestamp(), timestamp)
+
     def test_domain_event_instance(self):
         originator_id = uuid4()
         originator_version = 101
@@ -44,6 +92,40 @@ class TestDomainEvent(TestCase):
         self.assertEqual(a.originator_version, originator_version)
         self.assertEqual(a.timestamp, timestamp)
 
+    def test_hash(self):
+        originator_id = uuid4()
+        timestamp = DomainEvent.create_timestamp()
+        a = DomainEvent(
+            originator_id=originator_id,
+            originator_version=1,
+            timestamp=timestamp,
+        )
+        b = DomainEvent(
+            originator_id=originator_id,
+            originator_version=1,
+            timestamp=timestamp,
+        )
+        c = DomainEvent(
+            originator_id=originator_id,
+            originator_version=2,
+            timestamp=timestamp,
+        )
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b, c}), 2)
+
+        # Events with attribute values that aren't hashable can be hashed.
+        class Changed(DomainEvent):
+            values: List[int]
+
+        d = Changed(
+            originator_id=originator_id,
+            originator_version=3,
+            timestamp=timestamp,
+            values=[1, 2],
+        )
+        self.assertEqual(hash(d), hash((originator_id, 3)))
+
     def test_examples(self):
 
         # Define an 'account opened' domain event.
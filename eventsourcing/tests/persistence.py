@@ -6,11 +6,12 @@ import zlib
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from tempfile import NamedTemporaryFile
-from threading import Event, Thread, get_ident
+from threading import Event, Thread, local
 from time import sleep
 from timeit import timeit
-from typing import Any, Dict, List, Optional
+from typing import Any, Iterable, List, Optional
 from unittest import TestCase
 from uuid import UUID, uuid4
 
@@ -20,6 +21,7 @@ from eventsourcing.domain import DomainEvent
 from eventsourcing.persistence import (
     AggregateRecorder,
     ApplicationRecorder,
+    BatchingRecorderProxy,
     DatetimeAsISO,
     DecimalAsStr,
     InfrastructureFactory,
@@ -291,6 +293,21 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         self.assertEqual(notifications[2].topic, "topic3")
         self.assertEqual(notifications[2].state, b"state3")
 
+        notifications = recorder.select_notifications(
+            max_notification_id + 1, 3, include_state=False
+        )
+        self.assertEqual(len(notifications), 3)
+        self.assertEqual(notifications[0].id, max_notification_id + 1)
+        self.assertEqual(notifications[0].originator_id, originator_id1)
+        self.assertEqual(
+            notifications[0].originator_version, stored_event1.originator_version
+        )
+        self.assertEqual(notifications[0].topic, "topic1")
+        self.assertEqual(notifications[0].state, b"")
+        self.assertEqual(notifications[2].id, max_notification_id + 3)
+        self.assertEqual(notifications[2].topic, "topic3")
+        self.assertEqual(notifications[2].state, b"")
+
         notifications = recorder.select_notifications(
             max_notification_id + 1, 3, topics=["topic1", "topic2", "topic3"]
         )
@@ -390,9 +407,7 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         errors_happened = Event()
         errors: List[Exception] = []
 
-        counts = {}
-        threads: Dict[int, int] = {}
-        durations: Dict[int, float] = {}
+        writer_stats = WriterStatsPerThread()
 
         num_writers = 10
         num_writes_per_writer = 100
@@ -401,29 +416,14 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         writer_sleep = 0.0
 
         def insert_events() -> None:
-            thread_id = get_ident()
-            if thread_id not in threads:
-                threads[thread_id] = len(threads)
-            if thread_id not in counts:
-                counts[thread_id] = 0
-            if thread_id not in durations:
-                durations[thread_id] = 0
-
-            # thread_num = threads[thread_id]
-            # count = counts[thread_id]
+            stats = writer_stats.get()
 
             originator_id = uuid4()
-            stored_events = [
-                StoredEvent(
-                    originator_id=originator_id,
-                    originator_version=i,
-                    topic="topic",
-                    state=b"state",
-                )
-                for i in range(num_events_per_write)
-            ]
+            stored_events = create_stored_events(
+                originator_id, range(num_events_per_write), "topic", b"state"
+            )
             started = datetime.now()
-            # print(f"Thread {thread_num} write beginning #{count + 1}")
+            # print(f"Thread {stats.thread_num} write beginning #{stats.count + 1}")
             try:
                 recorder.insert_events(stored_events)
 
@@ -437,9 +437,9 @@ class ApplicationRecorderTestCase(TestCase, ABC):
             else:
                 ended = datetime.now()
                 duration = (ended - started).total_seconds()
-                counts[thread_id] += 1
-                if duration > durations[thread_id]:
-                    durations[thread_id] = duration
+                stats.count += 1
+                if duration > stats.max_duration:
+                    stats.max_duration = duration
                 sleep(writer_sleep)
 
         stop_reading = Event()
@@ -447,7 +447,7 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         def read_continuously() -> None:
             while not stop_reading.is_set():
                 try:
-                    recorder.select_notifications(0, 10)
+                    recorder.select_notifications(0, 10, include_state=False)
                 except Exception as e:  # pragma: nocover
                     errors.append(e)
                     return
@@ -481,10 +481,11 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         if errors:  # pragma: nocover
             raise errors[0]
 
-        for thread_id, thread_num in threads.items():
-            count = counts[thread_id]
-            duration = durations[thread_id]
-            print(f"Thread {thread_num} wrote {count} times (max dur {duration})")
+        for stats in writer_stats.all:
+            print(
+                f"Thread {stats.thread_num} wrote {stats.count} times "
+                f"(max dur {stats.max_duration})"
+            )
         self.assertFalse(errors_happened.is_set())
 
     def test_concurrent_throughput(self) -> None:
@@ -494,9 +495,7 @@ class ApplicationRecorderTestCase(TestCase, ABC):
 
         errors_happened = Event()
 
-        counts = {}
-        threads: Dict[int, int] = {}
-        durations: Dict[int, float] = {}
+        writer_stats = WriterStatsPerThread()
 
         # Match this to the batch page size in postgres insert for max throughput.
         NUM_EVENTS = 500
@@ -504,24 +503,12 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         started = datetime.now()
 
         def insert_events() -> None:
-            thread_id = get_ident()
-            if thread_id not in threads:
-                threads[thread_id] = len(threads)
-            if thread_id not in counts:
-                counts[thread_id] = 0
-            if thread_id not in durations:
-                durations[thread_id] = 0
+            stats = writer_stats.get()
 
             originator_id = uuid4()
-            stored_events = [
-                StoredEvent(
-                    originator_id=originator_id,
-                    originator_version=i,
-                    topic="topic",
-                    state=b"state",
-                )
-                for i in range(NUM_EVENTS)
-            ]
+            stored_events = create_stored_events(
+                originator_id, range(NUM_EVENTS), "topic", b"state"
+            )
 
             try:
                 recorder.insert_events(stored_events)
@@ -533,8 +520,8 @@ class ApplicationRecorderTestCase(TestCase, ABC):
             finally:
                 ended = datetime.now()
                 duration = (ended - started).total_seconds()
-                counts[thread_id] += 1
-                durations[thread_id] = duration
+                stats.count += 1
+                stats.max_duration = duration
 
         NUM_JOBS = 60
 
@@ -556,6 +543,22 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         """"""
 
 
+class BatchingRecorderProxyTestCase(ApplicationRecorderTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.proxies: List[BatchingRecorderProxy] = []
+
+    def tearDown(self) -> None:
+        for proxy in self.proxies:
+            proxy.close()
+        super().tearDown()
+
+    def create_proxy(self, recorder: ApplicationRecorder) -> BatchingRecorderProxy:
+        proxy = BatchingRecorderProxy(recorder)
+        self.proxies.append(proxy)
+        return proxy
+
+
 class ProcessRecorderTestCase(TestCase, ABC):
     @abstractmethod
     def create_recorder(self) -> ProcessRecorder:
@@ -1000,6 +1003,55 @@ def tmpfile_uris():
         yield "file:" + tmp_file.name
 
 
+class WriterStats:
+    """
+    Counts the writes of a writer thread, and records the longest duration.
+    """
+
+    def __init__(self, thread_num: int):
+        self.thread_num = thread_num
+        self.count = 0
+        self.max_duration = 0.0
+
+
+class WriterStatsPerThread:
+    """
+    Gives each writer thread its own stats object, so that writer threads
+    don't all update the same shared dicts.
+    """
+
+    def __init__(self) -> None:
+        self.all: List[WriterStats] = []
+        self._local = local()
+
+    def get(self) -> WriterStats:
+        try:
+            return self._local.stats
+        except AttributeError:
+            stats = WriterStats(thread_num=len(self.all))
+            self._local.stats = stats
+            self.all.append(stats)
+            return stats
+
+
+def create_stored_events(
+    originator_id: UUID, originator_versions: Iterable[int], topic: str, state: bytes
+) -> List[StoredEvent]:
+    """
+    Returns a list of stored events, one for each of the given originator
+    versions, with the same originator ID, topic, and state.
+    """
+    return list(
+        map(
+            StoredEvent,
+            repeat(originator_id),
+            originator_versions,
+            repeat(topic),
+            repeat(state),
+        )
+    )
+
+
 class CustomType1:
     def __init__(self, value: UUID):
         self.value = value
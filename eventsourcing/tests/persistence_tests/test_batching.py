@@ -0,0 +1,200 @@
+import gc
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event
+from time import sleep, time
+from typing import Any, List, Optional, Sequence
+from unittest import TestCase
+from uuid import uuid4
+
+from eventsourcing.persistence import (
+    BatchingRecorderProxy,
+    IntegrityError,
+    RecorderProxyClosed,
+    StoredEvent,
+    Tracking,
+)
+from eventsourcing.popo import POPOApplicationRecorder, POPOProcessRecorder
+from eventsourcing.sqlite import SQLiteApplicationRecorder, SQLiteDatastore
+from eventsourcing.tests.persistence import (
+    BatchingRecorderProxyTestCase,
+    create_stored_events,
+    tmpfile_uris,
+)
+
+
+class TestBatchingRecorderProxyWithPOPO(BatchingRecorderProxyTestCase):
+    def create_recorder(self):
+        return self.create_proxy(POPOApplicationRecorder())
+
+
+class TestBatchingRecorderProxyWithSQLite(BatchingRecorderProxyTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.uris = tmpfile_uris()
+        self.db_uri = next(self.uris)
+
+    def create_recorder(self):
+        recorder = SQLiteApplicationRecorder(
+            SQLiteDatastore(db_name=self.db_uri, pool_size=100)
+        )
+        recorder.create_table()
+        return self.create_proxy(recorder)
+
+
+class BlockingRecorder(POPOApplicationRecorder):
+    """
+    Blocks the first call to insert_events() until released,
+    so that concurrent calls are queued by the proxy.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[int] = []
+        self.started = Event()
+        self.released = Event()
+
+    def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Optional[Sequence[int]]:
+        self.calls.append(len(stored_events))
+        if len(self.calls) == 1:
+            self.started.set()
+            self.released.wait(timeout=5)
+        return super().insert_events(stored_events, **kwargs)
+
+
+class TestBatchingRecorderProxy(TestCase):
+    def wait_for_queue_size(self, proxy: BatchingRecorderProxy, size: int) -> None:
+        deadline = time() + 5
+        while proxy._queue.qsize() < size:
+            if time() > deadline:
+                self.fail(f"Timed out waiting for {size} queued calls")
+            sleep(0.001)
+
+    def test_concurrent_calls_are_combined(self) -> None:
+        recorder = BlockingRecorder()
+        proxy = BatchingRecorderProxy(recorder)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(
+                proxy.insert_events,
+                create_stored_events(uuid4(), [0], "topic", b"state"),
+            )
+            self.assertTrue(recorder.started.wait(timeout=5))
+            others = [
+                executor.submit(
+                    proxy.insert_events,
+                    create_stored_events(uuid4(), range(i + 1), "topic", b"state"),
+                )
+                for i in range(3)
+            ]
+            self.wait_for_queue_size(proxy, 3)
+            recorder.released.set()
+
+            self.assertEqual(first.result(), [1])
+            notification_ids = [f.result() for f in others]
+
+        # Three calls were combined into one call to the wrapped recorder.
+        self.assertEqual(recorder.calls, [1, 6])
+
+        # Each caller was returned the notification IDs of its own events.
+        self.assertEqual(sorted(sum(notification_ids, [])), [2, 3, 4, 5, 6, 7])
+        self.assertEqual([len(ids) for ids in notification_ids], [1, 2, 3])
+
+        proxy.close()
+
+    def test_only_conflicting_call_raises_integrity_error(self) -> None:
+        recorder = BlockingRecorder()
+        proxy = BatchingRecorderProxy(recorder)
+
+        originator_id = uuid4()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            first = executor.submit(
+                proxy.insert_events,
+                create_stored_events(uuid4(), [0], "topic", b"state"),
+            )
+            self.assertTrue(recorder.started.wait(timeout=5))
+            ok = executor.submit(
+                proxy.insert_events,
+                create_stored_events(originator_id, [0], "topic", b"state"),
+            )
+            self.wait_for_queue_size(proxy, 1)
+            conflicting = executor.submit(
+                proxy.insert_events,
+                create_stored_events(originator_id, [0], "topic", b"state"),
+            )
+            self.wait_for_queue_size(proxy, 2)
+            recorder.released.set()
+
+            first.result()
+            self.assertEqual(ok.result(), [2])
+            with self.assertRaises(IntegrityError):
+                conflicting.result()
+
+        self.assertEqual(len(proxy.select_events(originator_id)), 1)
+        self.assertEqual(proxy.max_notification_id(), 2)
+
+        proxy.close()
+
+    def test_calls_with_kwargs_are_not_queued(self) -> None:
+        recorder = POPOProcessRecorder()
+        proxy = BatchingRecorderProxy(recorder)
+        proxy.close()
+
+        # Committer thread is stopped, but call with tracking still works.
+        proxy.insert_events(
+            create_stored_events(uuid4(), [0], "topic", b"state"),
+            tracking=Tracking(application_name="upstream", notification_id=1),
+        )
+        self.assertEqual(recorder.max_tracking_id("upstream"), 1)
+
+    def test_insert_events_after_close_raises_error(self) -> None:
+        proxy = BatchingRecorderProxy(POPOApplicationRecorder())
+        proxy.close()
+
+        with self.assertRaises(RecorderProxyClosed):
+            proxy.insert_events(create_stored_events(uuid4(), [0], "topic", b"state"))
+
+        # Closing again doesn't hang.
+        proxy.close()
+
+    def test_calls_queued_when_committer_stops_raise_error(self) -> None:
+        recorder = BlockingRecorder()
+        proxy = BatchingRecorderProxy(recorder)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(
+                proxy.insert_events,
+                create_stored_events(uuid4(), [0], "topic", b"state"),
+            )
+            self.assertTrue(recorder.started.wait(timeout=5))
+            closing = executor.submit(proxy.close)
+            self.wait_for_queue_size(proxy, 1)
+
+            # Simulate a call queued behind the stop sentinel.
+            future: Future = Future()
+            proxy._queue.put(
+                (create_stored_events(uuid4(), [0], "topic", b"state"), future)
+            )
+            recorder.released.set()
+
+            self.assertEqual(first.result(), [1])
+            closing.result()
+
+        with self.assertRaises(RecorderProxyClosed):
+            future.result(timeout=5)
+        self.assertEqual(recorder.calls, [1])
+
+    def test_committer_thread_stops_when_unclosed_proxy_is_collected(self) -> None:
+        proxy = BatchingRecorderProxy(POPOApplicationRecorder())
+        proxy.insert_events(create_stored_events(uuid4(), [0], "topic", b"state"))
+        committer_thread = proxy._committer_thread
+
+        del proxy
+        gc.collect()
+
+        committer_thread.join(timeout=5)
+        self.assertFalse(committer_thread.is_alive())
+
+
+del BatchingRecorderProxyTestCase
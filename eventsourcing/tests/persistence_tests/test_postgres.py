@@ -35,6 +35,7 @@ from eventsourcing.postgres import (
 from eventsourcing.tests.persistence import (
     AggregateRecorderTestCase,
     ApplicationRecorderTestCase,
+    BatchingRecorderProxyTestCase,
     InfrastructureFactoryTestCase,
     ProcessRecorderTestCase,
 )
@@ -1008,6 +1009,23 @@ class TestPostgresApplicationRecorderWithSchema(
     pass
 
 
+class TestPostgresBatchingRecorderProxy(
+    SetupPostgresDatastore, BatchingRecorderProxyTestCase
+):
+    def create_recorder(self, table_name=EVENTS_TABLE_NAME):
+        if self.datastore.schema:
+            table_name = f"{self.datastore.schema}.{table_name}"
+        recorder = PostgresApplicationRecorder(
+            self.datastore, events_table_name=table_name
+        )
+        recorder.create_table()
+        return self.create_proxy(recorder)
+
+    def test_concurrent_throughput(self):
+        self.datastore.pool.pool_size = 4
+        super().test_concurrent_throughput()
+
+
 class TestPostgresApplicationRecorderErrors(SetupPostgresDatastore, TestCase):
     def create_recorder(self, table_name=EVENTS_TABLE_NAME):
         return PostgresApplicationRecorder(self.datastore, events_table_name=table_name)
@@ -1517,6 +1535,7 @@ class TestPostgresInfrastructureFactory(InfrastructureFactoryTestCase):
 
 del AggregateRecorderTestCase
 del ApplicationRecorderTestCase
+del BatchingRecorderProxyTestCase
 del ProcessRecorderTestCase
 del InfrastructureFactoryTestCase
 del SetupPostgresDatastore
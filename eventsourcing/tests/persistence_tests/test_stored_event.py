@@ -0,0 +1,49 @@
+import pickle
+from copy import deepcopy
+from dataclasses import FrozenInstanceError, replace
+from unittest.case import TestCase
+from uuid import uuid4
+
+from eventsourcing.persistence import Notification, StoredEvent
+
+
+class TestStoredEvent(TestCase):
+    def test_stored_event(self):
+        stored_event = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic",
+            state=b"state",
+        )
+
+        # Check stored events don't have a __dict__.
+        self.assertFalse(hasattr(stored_event, "__dict__"))
+
+        # Check stored events are immutable.
+        with self.assertRaises(FrozenInstanceError):
+            stored_event.topic = "other"  # type: ignore
+
+        # Check stored events can be pickled and copied.
+        self.assertEqual(pickle.loads(pickle.dumps(stored_event)), stored_event)
+        self.assertEqual(deepcopy(stored_event), stored_event)
+
+    def test_notification(self):
+        notification = Notification(
+            id=1,
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic",
+            state=b"state",
+        )
+
+        # Check notifications don't have a __dict__.
+        self.assertFalse(hasattr(notification, "__dict__"))
+
+        # Check notifications are immutable.
+        with self.assertRaises(FrozenInstanceError):
+            notification.id = 2  # type: ignore
+
+        # Check notifications can be pickled, copied, and replaced.
+        self.assertEqual(pickle.loads(pickle.dumps(notification)), notification)
+        self.assertEqual(deepcopy(notification), notification)
+        self.assertEqual(replace(notification, id=2).id, 2)
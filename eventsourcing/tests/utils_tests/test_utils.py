@@ -7,6 +7,7 @@ from eventsourcing.utils import (
     TopicError,
     clear_topic_cache,
     get_topic,
+    get_upcasts,
     register_topic,
     resolve_topic,
     retry,
@@ -152,6 +153,38 @@ class TestStrtobool(TestCase):
                 strtobool(cast(str, x))
 
 
+class TestGetUpcasts(TestCase):
+    def test(self):
+        class MyClass:
+            class_version = 3
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                state["b"] = 2
+
+            @staticmethod
+            def upcast_v2_v3(state):
+                state["c"] = 3
+
+        self.assertEqual(
+            get_upcasts(MyClass, 1), (MyClass.upcast_v1_v2, MyClass.upcast_v2_v3)
+        )
+        self.assertEqual(get_upcasts(MyClass, 2), (MyClass.upcast_v2_v3,))
+        self.assertEqual(get_upcasts(MyClass, 3), ())
+
+        class NotVersioned:
+            pass
+
+        self.assertEqual(get_upcasts(NotVersioned, 1), ())
+
+    def test_raises_attribute_error_if_upcast_missing(self):
+        class MyClass:
+            class_version = 2
+
+        with self.assertRaises(AttributeError):
+            get_upcasts(MyClass, 1)
+
+
 class TestTopics(TestCase):
     def test_get_topic(self):
         self.assertEqual("eventsourcing.domain:Aggregate", get_topic(Aggregate))
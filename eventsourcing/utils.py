@@ -1,6 +1,6 @@
 import importlib
 import sys
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import isfunction
 from random import random
 from threading import Lock
@@ -15,6 +15,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -230,6 +231,21 @@ def get_method_name(method: Union[FunctionType, WrapperDescriptorType]) -> str:
         return method.__name__
 
 
+@lru_cache(maxsize=None)
+def get_upcasts(
+    cls: type, from_version: int
+) -> Tuple[Callable[[Dict[str, Any]], None], ...]:
+    """
+    Returns the class's "upcast" methods, in order, that will upcast
+    the state of an object from the given version to the class version.
+    """
+    class_version = getattr(cls, "class_version", 1)
+    return tuple(
+        getattr(cls, f"upcast_v{version}_v{version + 1}")
+        for version in range(from_version, class_version)
+    )
+
+
 EnvType = Mapping[str, str]
 T = TypeVar("T")
 